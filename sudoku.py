@@ -1,18 +1,39 @@
-import pandas as pd
 import numpy as np
 import random
 import time  
 import csv 
 import os
+import sys
+
+# Candidate bitmasks: bit i set means digit i+1 is still allowed
+ALL_DIGITS = 0x1FF
+# Number of set bits for every 9-bit candidate mask
+POPCOUNT = [bin(m).count('1') for m in range(ALL_DIGITS + 1)]
+# Digit for every non-empty cell string, anything else is an empty cell
+DIGIT_OF = {str(d): d for d in range(1, 10)}
+# Box number of every cell
+BOX_OF = [[(r // 3) * 3 + c // 3 for c in range(9)] for r in range(9)]
+
+def occupancy_masks(grid):
+    """
+    Row, column and box occupancy bitmasks of a numpy grid, as three uint16 arrays
+    Each filled cell's digit bit is OR-reduced along its row, column and box
+    """
+    bits = np.where(grid > 0, 1 << (np.maximum(grid, 1).astype(np.uint16) - 1), 0).astype(np.uint16)
+    row_mask = np.bitwise_or.reduce(bits, axis=1)
+    col_mask = np.bitwise_or.reduce(bits, axis=0)
+    box_mask = np.bitwise_or.reduce(bits.reshape(3, 3, 3, 3), axis=(1, 3)).ravel()
+    return row_mask, col_mask, box_mask
 
 class SudokuSolver:
     
     def __init__(self, filepath):
         
-        # Constructor: Initializes the solver, keeps a copy of the original board
+        # Constructor: Initializes the solver
+        # Cells filled while solving are recorded instead of copying the original board
         self.filepath = filepath
         self.board = self.load_puzzle(filepath)
-        self.original_board = self.board.copy() 
+        self._filled = []
         
         # Metrics
         self.start_time = 0
@@ -20,6 +41,14 @@ class SudokuSolver:
         self.recursive_calls = 0
         self.backtracks = 0
 
+    @property
+    def original_board(self):
+        """The puzzle as loaded: the board with every solver-filled cell cleared"""
+        board = self.board.copy()
+        for r, c in self._filled:
+            board[r, c] = 0
+        return board
+
     def load_puzzle(self, filepath):
         """
         Loads a puzzle from a .txt or .csv file
@@ -33,14 +62,20 @@ class SudokuSolver:
                 if filepath.endswith('.csv'):
                     reader = csv.reader(f)
                     for row in reader:
-                        board.append([int(c) if c.isdigit() and c != '0' else 0 for c in row])
+                        board.append([DIGIT_OF.get(c, 0) for c in row])
                 else: # Assume .txt
                     for line in f:
                         line = line.strip()
                         if not line: continue
                         # Handle comma-separated or just characters
-                        cells = line.split(',') if ',' in line else list(line)
-                        row = [int(c.strip()) if c.strip().isdigit() and c.strip() != '0' else 0 for c in cells]
+                        if ',' in line:
+                            cells = line.split(',')
+                            row = [DIGIT_OF.get(c.strip(), 0) for c in cells]
+                        else:
+                            # One character per cell: decode the ASCII bytes in one step,
+                            # anything outside '0'-'9' wraps past 9 and becomes empty
+                            row = np.frombuffer(line.encode('ascii', 'replace'), dtype=np.uint8) - ord('0')
+                            row = np.where(row <= 9, row, 0)
                         if len(row) == 9:
                             board.append(row)
             
@@ -50,7 +85,7 @@ class SudokuSolver:
             
             print(f"Successfully loaded puzzle from: {filepath}")
             # Convert to numpy array
-            return np.array(board, dtype=int)
+            return np.array(board, dtype=np.int8)
 
         except FileNotFoundError:
             print(f"Error: File not found at {filepath}")
@@ -60,71 +95,130 @@ class SudokuSolver:
             exit(1)
 
     def print_board(self, board=None):
-        # Prints the board in a readable format
+        # Prints the board in a readable format, built as one string and written once
         if board is None:
             board = self.board
-            
-        print("\n+-------+-------+-------+")
+
+        lines = ["", "+-------+-------+-------+"]
         for i in range(9):
             if i % 3 == 0 and i != 0:
-                print("|-------+-------+-------|")
-            row_str = "| "
-            for j in range(9):
-                if j % 3 == 0 and j != 0:
-                    row_str += "| "
-                cell = str(board[i, j]) if board[i, j] != 0 else '.'
-                row_str += cell + " "
-            row_str += "|"
-            print(row_str)
-        print("+-------+-------+-------+")
-    
-    def is_valid_placement(self, grid, row, col, num):
-        """Checks if placing 'num' at (row, col) is valid"""
-        # Check Row
-        if num in grid[row, :]:
-            return False
-        # Check Column
-        if num in grid[:, col]:
-            return False
-        # Check 3x3 Box
-        r_start = (row // 3) * 3
-        c_start = (col // 3) * 3
-        if num in grid[r_start:r_start+3, c_start:c_start+3]:
-            return False
-        return True
-
-    def find_empty_cell(self, grid):
-        """Finds the next empty cell (0)"""
-        for r in range(9):
-            for c in range(9):
-                if grid[r, c] == 0:
-                    return r, c
-        return None
+                lines.append("|-------+-------+-------|")
+            cells = [str(v) if v != 0 else '.' for v in board[i].tolist()]
+            lines.append(f"| {' '.join(cells[0:3])} | {' '.join(cells[3:6])} | {' '.join(cells[6:9])} |")
+        lines.append("+-------+-------+-------+")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _solve_backtracking(self):
-        """Recursive solver"""
-        
-        # Metric 1: Count recursive calls
-        self.recursive_calls += 1
+        """Backtracking solver, with an explicit stack of guesses instead of recursion"""
+        stack = []  # (row, col, box, untried candidates, forced cells) for every guess
+
+        while True:
+            # Metric 1: Count recursive calls (one per visited node)
+            self.recursive_calls += 1
+
+            cell = self._select_cell()
+            if cell is None:
+                return True  # Solved
 
-        empty_cell = self.find_empty_cell(self.board)
-        if not empty_cell:
-            return True  # Base case: Solved
+            row, col, cand = cell
+            box = BOX_OF[row][col]
 
-        row, col = empty_cell
+            while True:
+                # Dead end: undo guesses until a cell has an untried candidate
+                while not cand:
+                    if not stack:
+                        return False  # No solution
+                    row, col, box, cand, forced = stack.pop()
+                    self._undo(forced)
 
-        for num in range(1, 10):
-            if self.is_valid_placement(self.board, row, col, num):
-                self.board[row, col] = num
+                    # Metric 2: Count backtracks
+                    self.backtracks += 1
+                    self._unplace(row, col, box) # Backtrack
 
-                if self._solve_backtracking():  
-                    return True # Solution found
+                # Place the lowest remaining candidate and fill the cells it forces
+                bit = cand & -cand
+                cand ^= bit
+                self._place(row, col, box, bit)
+                forced = self._propagate()
+                if forced is not None:
+                    stack.append((row, col, box, cand, forced))
+                    break
 
-                # Metric 2: Count backtracks
+                # Propagation hit a contradiction: try the next candidate
                 self.backtracks += 1
-                self.board[row, col] = 0 # Backtrack
+                self._unplace(row, col, box) # Backtrack
 
-        return False # Triggers backtracking
+    def _propagate(self):
+        """
+        Constraint propagation: fills every empty cell left with a single
+        candidate, repeating until no cell is forced
+        Returns the list of (row, col, box) cells filled, or None on a dead end
+        (with its own placements already undone)
+        """
+        grid = self._grid
+        rows, cols, boxes = self._rows, self._cols, self._boxes
+        forced = []
+        progress = True
+        while progress:
+            progress = False
+            for r, c, b in self._empties:
+                if grid[r][c] == 0:
+                    cand = ALL_DIGITS & ~(rows[r] | cols[c] | boxes[b])
+                    if cand & (cand - 1):
+                        continue
+                    if not cand:
+                        self._undo(forced)
+                        return None
+                    self._place(r, c, b, cand)
+                    forced.append((r, c, b))
+                    progress = True
+        return forced
+
+    def _place(self, row, col, box, bit):
+        """Writes the digit for 'bit' into the search grid and marks it in the masks"""
+        self._grid[row][col] = bit.bit_length()
+        self._rows[row] |= bit
+        self._cols[col] |= bit
+        self._boxes[box] |= bit
+
+    def _unplace(self, row, col, box):
+        """Clears a cell filled by _place, most recent first"""
+        bit = 1 << (self._grid[row][col] - 1)
+        self._grid[row][col] = 0
+        self._rows[row] &= ~bit
+        self._cols[col] &= ~bit
+        self._boxes[box] &= ~bit
+
+    def _undo(self, forced):
+        """Clears the cells filled by one _propagate call"""
+        for r, c, b in reversed(forced):
+            self._unplace(r, c, b)
+
+    def _select_cell(self):
+        """
+        Minimum Remaining Values: picks the empty cell with the fewest candidates
+        Returns (row, col, candidate_mask), or None when the grid is full
+        A mask of 0 means a dead end
+        """
+        grid = self._grid
+        rows, cols, boxes = self._rows, self._cols, self._boxes
+        best = None
+        best_count = 10
+        # Only cells that were empty when the search started can still be empty
+        for r, c, b in self._empties:
+            if grid[r][c] == 0:
+                cand = ALL_DIGITS & ~(rows[r] | cols[c] | boxes[b])
+                count = POPCOUNT[cand]
+                if count <= 1:
+                    return r, c, cand  # Forced move or dead end
+                if count < best_count:
+                    best = r, c, cand
+                    best_count = count
+        return best
+
+    def _init_masks(self):
+        """Builds row, column and box occupancy bitmasks from the board"""
+        self._rows, self._cols, self._boxes = (m.tolist() for m in occupancy_masks(self.board))
 
     def solve(self):
         """Public method to run the solver and print metrics"""
@@ -133,9 +227,21 @@ class SudokuSolver:
         
         # Metric 3: Track execution time
         self.start_time = time.perf_counter()
-        
-        if self._solve_backtracking():
+
+        # The search state (grid, masks, lookup tables) is kept in plain lists:
+        # it is indexed one cell at a time, and scalar indexing into Python
+        # lists is cheaper than into numpy arrays
+        self._grid = self.board.tolist()
+        self._empties = [(r, c, BOX_OF[r][c]) for r, c in
+                         (divmod(int(i), 9) for i in np.flatnonzero(self.board.ravel() == 0))]
+        self._init_masks()
+        solved = self._solve_backtracking()
+        self.board[:] = self._grid
+
+        if solved:
             self.end_time = time.perf_counter()
+            # Appended, not reassigned: a later solve() finds no empty cells
+            self._filled.extend((r, c) for r, c, b in self._empties)
             print("\n--- Sudoku Solved! ---")
             self.print_board(self.board)
         else: